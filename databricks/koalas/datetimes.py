@@ -22,12 +22,18 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pandas as pd  # noqa: F401
 import pyspark.sql.functions as F
+from pyspark.sql import Column
 from pyspark.sql.types import DateType, TimestampType, LongType
 
 if TYPE_CHECKING:
     import databricks.koalas as ks
 
 
+def _is_leap_year(year_scol: Column) -> Column:
+    """ Return the Spark Column indicating whether the given year is a leap year. """
+    return ((year_scol % 4 == 0) & (year_scol % 100 != 0)) | (year_scol % 400 == 0)
+
+
 class DatetimeMethods(object):
     """Date/Time methods for Koalas Series"""
 
@@ -192,10 +198,7 @@ class DatetimeMethods(object):
         The quarter of the date.
         """
 
-        def pandas_quarter(s) -> "ks.Series[np.int64]":
-            return s.dt.quarter
-
-        return self._data.koalas.transform_batch(pandas_quarter)
+        return self._data.spark.transform(lambda c: F.quarter(c).cast(LongType()))
 
     @property
     def is_month_start(self) -> "ks.Series":
@@ -487,10 +490,10 @@ class DatetimeMethods(object):
         dtype: bool
         """
 
-        def pandas_is_leap_year(s) -> "ks.Series[bool]":
-            return s.dt.is_leap_year
-
-        return self._data.koalas.transform_batch(pandas_is_leap_year)
+        # pandas returns False for NaT.
+        return self._data.spark.transform(
+            lambda c: F.coalesce(_is_leap_year(F.year(c)), F.lit(False))
+        )
 
     @property
     def daysinmonth(self) -> "ks.Series":
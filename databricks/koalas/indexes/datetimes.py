@@ -13,17 +13,71 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from collections import OrderedDict
 from functools import partial
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import pandas as pd
-from pandas.api.types import is_hashable
+from pandas.api.types import is_datetime64_any_dtype, is_hashable
+from pyspark import sql as spark
 from pyspark._globals import _NoValue
+from pyspark.sql import functions as F
+from pyspark.sql.types import LongType
 
 from databricks import koalas as ks
+from databricks.koalas.datetimes import _is_leap_year
+from databricks.koalas.frame import DataFrame
 from databricks.koalas.indexes.base import Index
 from databricks.koalas.missing.indexes import MissingPandasLikeDatetimeIndex
 from databricks.koalas.series import Series
+from databricks.koalas.utils import cache_readonly
+
+
+def _days_in_month(scol: spark.Column) -> spark.Column:
+    month = F.month(scol)
+    return (
+        F.when(month == 2, F.when(_is_leap_year(F.year(scol)), 29).otherwise(28))
+        .when(month.isin(4, 6, 9, 11), 30)
+        .when(month.isNotNull(), 31)
+    )
+
+
+# Datetime fields which can be computed natively by Spark, mapped to the functions
+# building the Spark Column for each field from the datetime Spark Column. The order is
+# the default column order of `DatetimeIndex.components`.
+_SPARK_DATETIME_FIELDS = OrderedDict(
+    [
+        ("year", F.year),
+        ("month", F.month),
+        ("day", F.dayofmonth),
+        ("hour", F.hour),
+        ("minute", F.minute),
+        ("second", F.second),
+        ("week", F.weekofyear),
+        ("weekofyear", F.weekofyear),
+        # Spark's dayofweek is Sunday=1, Saturday=7 whereas pandas' is Monday=0, Sunday=6.
+        ("dayofweek", lambda scol: (F.dayofweek(scol) + 5) % 7),
+        ("weekday", lambda scol: (F.dayofweek(scol) + 5) % 7),
+        ("dayofyear", F.dayofyear),
+        ("quarter", F.quarter),
+        ("daysinmonth", _days_in_month),
+        ("days_in_month", _days_in_month),
+    ]
+)
+
+
+def _resolve_missing_attribute(name: str) -> Tuple[bool, Any]:
+    property_or_func = getattr(MissingPandasLikeDatetimeIndex, name)
+    return isinstance(property_or_func, property), property_or_func
+
+
+# The attributes of MissingPandasLikeDatetimeIndex with whether each is a property, resolved
+# once so that the attribute misses in `DatetimeIndex.__getattr__` are a single dict lookup.
+_MISSING_ATTRIBUTES = {
+    name: _resolve_missing_attribute(name)
+    for name in dir(MissingPandasLikeDatetimeIndex)
+    if not name.startswith("__")
+}
 
 
 class DatetimeIndex(Index):
@@ -113,29 +167,147 @@ class DatetimeIndex(Index):
                 dtype = "datetime64[ns]"
             return Index(data, dtype=dtype, copy=copy, name=name)
 
-        kwargs = dict(
-            data=data,
-            normalize=normalize,
-            closed=closed,
-            ambiguous=ambiguous,
-            dayfirst=dayfirst,
-            yearfirst=yearfirst,
-            dtype=dtype,
-            copy=copy,
-            name=name,
-        )
-        if freq is not _NoValue:
-            kwargs["freq"] = freq
-        return ks.from_pandas(pd.DatetimeIndex(**kwargs))
+        if (
+            freq is _NoValue
+            and not normalize
+            and dtype is None
+            and is_datetime64_any_dtype(getattr(data, "dtype", None))
+        ):
+            # The data is already parsed, so the parsing options do not apply to it.
+            if isinstance(data, pd.DatetimeIndex):
+                # `from_pandas` copies the data to Spark anyway.
+                return ks.from_pandas(data if name is None else data.rename(name))
+            return ks.from_pandas(pd.DatetimeIndex(data, copy=copy, name=name))
+
+        if (
+            freq is _NoValue
+            and not normalize
+            and closed is None
+            and isinstance(ambiguous, str)
+            and ambiguous == "raise"
+            and not dayfirst
+            and not yearfirst
+            and dtype is None
+            and not copy
+        ):
+            # All the options are the defaults, which is the most common case.
+            return ks.from_pandas(pd.DatetimeIndex(data, name=name))
+
+        if freq is _NoValue:
+            pidx = pd.DatetimeIndex(
+                data,
+                normalize=normalize,
+                closed=closed,
+                ambiguous=ambiguous,
+                dayfirst=dayfirst,
+                yearfirst=yearfirst,
+                dtype=dtype,
+                copy=copy,
+                name=name,
+            )
+        else:
+            pidx = pd.DatetimeIndex(
+                data,
+                freq=freq,
+                normalize=normalize,
+                closed=closed,
+                ambiguous=ambiguous,
+                dayfirst=dayfirst,
+                yearfirst=yearfirst,
+                dtype=dtype,
+                copy=copy,
+                name=name,
+            )
+        return ks.from_pandas(pidx)
 
     def __getattr__(self, item: str) -> Any:
-        if hasattr(MissingPandasLikeDatetimeIndex, item):
-            property_or_func = getattr(MissingPandasLikeDatetimeIndex, item)
-            if isinstance(property_or_func, property):
-                return property_or_func.fget(self)  # type: ignore
-            else:
-                return partial(property_or_func, self)
-        raise AttributeError("'DatetimeIndex' object has no attribute '{}'".format(item))
+        try:
+            is_property, property_or_func = _MISSING_ATTRIBUTES[item]
+        except KeyError:
+            raise AttributeError("'DatetimeIndex' object has no attribute '{}'".format(item))
+        if is_property:
+            return property_or_func.fget(self)  # type: ignore
+        else:
+            return partial(property_or_func, self)
+
+    @property
+    def _cache(self) -> dict:
+        # The anchor DataFrame can be updated in place, e.g., by renaming the index,
+        # so the cache is only valid as long as the anchor keeps the same InternalFrame.
+        internal = self._kdf._internal
+        if self.__dict__.get("_cache_internal") is not internal:
+            self.__dict__["_cache_internal"] = internal
+            self.__dict__["_cache_dict"] = {}
+        return self.__dict__["_cache_dict"]
+
+    @cache_readonly
+    def _dt_series(self) -> Series:
+        return self.to_series()
+
+    def components(self, fields: Optional[List[str]] = None) -> DataFrame:
+        """
+        Return a DataFrame of the datetime fields of the index.
+
+        All the fields are computed in a single Spark projection, so this is faster than
+        accessing each field property separately when several fields are needed.
+
+        Parameters
+        ----------
+        fields : list of str, optional
+            The fields to compute, any of 'year', 'month', 'day', 'hour', 'minute',
+            'second', 'week', 'weekofyear', 'dayofweek', 'weekday', 'dayofyear',
+            'quarter', 'daysinmonth' and 'days_in_month'. If not specified, all the fields
+            are computed in that order.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame indexed by this index with a column for each field.
+
+        Examples
+        --------
+        >>> idx = ks.date_range('2016-12-31', periods=3, freq='D')
+        >>> idx.components(['year', 'month', 'day'])
+                    year  month  day
+        2016-12-31  2016     12   31
+        2017-01-01  2017      1    1
+        2017-01-02  2017      1    2
+        """
+        if fields is None:
+            fields = list(_SPARK_DATETIME_FIELDS)
+        else:
+            unknown = [field for field in fields if field not in _SPARK_DATETIME_FIELDS]
+            if len(unknown) > 0:
+                raise ValueError("Unknown datetime fields: {}".format(unknown))
+
+        internal = self._kdf._internal.with_new_columns(
+            [self._field_scol(field).alias(field) for field in fields],
+            column_labels=[(field,) for field in fields],
+            column_label_names=None,
+        )
+        return DataFrame(internal)
+
+    def _field_scol(self, field: str) -> spark.Column:
+        """ Return the Spark Column computing the given datetime field. """
+        # The Spark Column is cached along with `_dt_series` until the anchor is updated.
+        key = "_field_scol_{}".format(field)
+        cache = self._cache
+        if key not in cache:
+            cache[key] = _SPARK_DATETIME_FIELDS[field](self.spark.column).cast(LongType())
+        return cache[key]
+
+    def _with_new_field(self, field: str) -> Index:
+        """
+        Copy DatetimeIndex with the given datetime field as the index values.
+
+        :param field: the field name, one of the keys of `_SPARK_DATETIME_FIELDS`
+        :return: the Index of the field
+        """
+        return self._with_new_scol(self._field_scol(field))
+
+    def _with_new_bool_scol(self, scol) -> Index:
+        # pandas returns False for NaT whereas Spark returns null for the null timestamps.
+        return self._with_new_scol(F.coalesce(scol, F.lit(False)))
 
     # Properties
     @property
@@ -143,60 +315,60 @@ class DatetimeIndex(Index):
         """
         The year of the datetime.
         """
-        return Index(self.to_series().dt.year)
+        return self._with_new_field("year")
 
     @property
     def month(self) -> Index:
         """
         The month of the timestamp as January = 1 December = 12.
         """
-        return Index(self.to_series().dt.month)
+        return self._with_new_field("month")
 
     @property
     def day(self) -> Index:
         """
         The days of the datetime.
         """
-        return Index(self.to_series().dt.day)
+        return self._with_new_field("day")
 
     @property
     def hour(self) -> Index:
         """
         The hours of the datetime.
         """
-        return Index(self.to_series().dt.hour)
+        return self._with_new_field("hour")
 
     @property
     def minute(self) -> Index:
         """
         The minutes of the datetime.
         """
-        return Index(self.to_series().dt.minute)
+        return self._with_new_field("minute")
 
     @property
     def second(self) -> Index:
         """
         The seconds of the datetime.
         """
-        return Index(self.to_series().dt.second)
+        return self._with_new_field("second")
 
     @property
     def microsecond(self) -> Index:
         """
         The microseconds of the datetime.
         """
-        return Index(self.to_series().dt.microsecond)
+        return Index(self._dt_series.dt.microsecond)
 
     @property
     def week(self) -> Index:
         """
         The week ordinal of the year.
         """
-        return Index(self.to_series().dt.week)
+        return self._with_new_field("week")
 
     @property
     def weekofyear(self) -> Index:
-        return Index(self.to_series().dt.weekofyear)
+        return self.week
 
     weekofyear.__doc__ = week.__doc__
 
@@ -226,7 +398,7 @@ class DatetimeIndex(Index):
         >>> idx.dayofweek
         Int64Index([5, 6, 0, 1, 2, 3, 4, 5, 6], dtype='int64')
         """
-        return Index(self.to_series().dt.dayofweek)
+        return self._with_new_field("dayofweek")
 
     @property
     def day_of_week(self) -> Index:
@@ -236,7 +408,7 @@ class DatetimeIndex(Index):
 
     @property
     def weekday(self) -> Index:
-        return Index(self.to_series().dt.weekday)
+        return self.dayofweek
 
     weekday.__doc__ = dayofweek.__doc__
 
@@ -245,7 +417,7 @@ class DatetimeIndex(Index):
         """
         The ordinal day of the year.
         """
-        return Index(self.to_series().dt.dayofyear)
+        return self._with_new_field("dayofyear")
 
     @property
     def day_of_year(self) -> Index:
@@ -258,7 +430,7 @@ class DatetimeIndex(Index):
         """
         The quarter of the date.
         """
-        return Index(self.to_series().dt.quarter)
+        return self._with_new_field("quarter")
 
     @property
     def is_month_start(self) -> Index:
@@ -281,7 +453,7 @@ class DatetimeIndex(Index):
         >>> idx.is_month_start
         Index([False, False, True], dtype='object')
         """
-        return Index(self.to_series().dt.is_month_start)
+        return self._with_new_bool_scol(F.dayofmonth(self.spark.column) == 1)
 
     @property
     def is_month_end(self) -> Index:
@@ -304,7 +476,8 @@ class DatetimeIndex(Index):
         >>> idx.is_month_end
         Index([False, True, False], dtype='object')
         """
-        return Index(self.to_series().dt.is_month_end)
+        scol = self.spark.column
+        return self._with_new_bool_scol(F.dayofmonth(scol) == F.dayofmonth(F.last_day(scol)))
 
     @property
     def is_quarter_start(self) -> Index:
@@ -327,7 +500,8 @@ class DatetimeIndex(Index):
         >>> idx.is_quarter_start
         Index([False, False, True, False], dtype='object')
         """
-        return Index(self.to_series().dt.is_quarter_start)
+        scol = self.spark.column
+        return self._with_new_bool_scol((F.dayofmonth(scol) == 1) & (F.month(scol) % 3 == 1))
 
     @property
     def is_quarter_end(self) -> Index:
@@ -350,7 +524,10 @@ class DatetimeIndex(Index):
         >>> idx.is_quarter_end
         Index([False, True, False, False], dtype='object')
         """
-        return Index(self.to_series().dt.is_quarter_end)
+        scol = self.spark.column
+        return self._with_new_bool_scol(
+            (F.dayofmonth(scol) == F.dayofmonth(F.last_day(scol))) & (F.month(scol) % 3 == 0)
+        )
 
     @property
     def is_year_start(self) -> Index:
@@ -372,7 +549,7 @@ class DatetimeIndex(Index):
         >>> idx.is_year_start
         Index([False, False, True], dtype='object')
         """
-        return Index(self.to_series().dt.is_year_start)
+        return self._with_new_bool_scol(F.dayofyear(self.spark.column) == 1)
 
     @property
     def is_year_end(self) -> Index:
@@ -394,7 +571,8 @@ class DatetimeIndex(Index):
         >>> idx.is_year_end
         Index([False, True, False], dtype='object')
         """
-        return Index(self.to_series().dt.is_year_end)
+        scol = self.spark.column
+        return self._with_new_bool_scol((F.month(scol) == 12) & (F.dayofmonth(scol) == 31))
 
     @property
     def is_leap_year(self) -> Index:
@@ -417,17 +595,17 @@ class DatetimeIndex(Index):
         >>> idx.is_leap_year
         Index([True, False, False], dtype='object')
         """
-        return Index(self.to_series().dt.is_leap_year)
+        return self._with_new_bool_scol(_is_leap_year(F.year(self.spark.column)))
 
     @property
     def daysinmonth(self) -> Index:
         """
         The number of days in the month.
         """
-        return Index(self.to_series().dt.daysinmonth)
+        return self._with_new_field("daysinmonth")
 
     @property
     def days_in_month(self) -> Index:
-        return Index(self.to_series().dt.days_in_month)
+        return self.daysinmonth
 
     days_in_month.__doc__ = daysinmonth.__doc__
@@ -19,6 +19,7 @@ from distutils.version import LooseVersion
 import pandas as pd
 
 import databricks.koalas as ks
+from databricks.koalas.exceptions import PandasNotImplementedError
 from databricks.koalas.testing.utils import ReusedSQLTestCase, TestUtils
 
 
@@ -44,6 +45,7 @@ class DatetimeIndexTest(ReusedSQLTestCase, TestUtils):
         return [
             pd.DatetimeIndex([0]),
             pd.DatetimeIndex(["2004-01-01", "2002-12-31", "2000-04-01"]),
+            pd.DatetimeIndex(["2100-02-01", "2000-02-01", "2004-02-01", "2019-11-01"]),
         ] + [
             pd.date_range("2000-01-01", periods=3, freq=freq)
             for freq in (self.fixed_freqs + self.non_fixed_freqs)
@@ -85,3 +87,115 @@ class DatetimeIndexTest(ReusedSQLTestCase, TestUtils):
             if LooseVersion(pd.__version__) >= LooseVersion("1.2.0"):
                 self.assert_eq(kidx.day_of_year, pidx.day_of_year)
                 self.assert_eq(kidx.day_of_week, pidx.day_of_week)
+
+    def test_properties_after_rename(self):
+        pidx = pd.DatetimeIndex(["2004-01-01", "2002-12-31", "2000-04-01"])
+        kidx = ks.from_pandas(pidx)
+        self.assert_eq(kidx.year, pidx.year)
+
+        pidx.name = kidx.name = "dates"
+        self.assert_eq(kidx.year, pidx.year)
+        self.assert_eq(kidx.month, pidx.month)
+
+    def test_components(self):
+        fields = [
+            "year",
+            "month",
+            "day",
+            "hour",
+            "minute",
+            "second",
+            "week",
+            "weekofyear",
+            "dayofweek",
+            "weekday",
+            "dayofyear",
+            "quarter",
+            "daysinmonth",
+            "days_in_month",
+        ]
+        for kidx, pidx in self.idx_pairs:
+            pdf = pd.DataFrame(
+                {field: getattr(pidx, field) for field in fields}, index=pidx, columns=fields
+            )
+            self.assert_eq(kidx.components(), pdf)
+            self.assert_eq(kidx.components(["year", "day"]), pdf[["year", "day"]])
+
+        kidx = self.kidxs[0]
+        self.assertRaises(ValueError, lambda: kidx.components(["year", "nanosecond"]))
+
+    def test_boolean_properties_with_nat(self):
+        pidx = pd.DatetimeIndex(["2000-02-29", None, "2000-12-31", "2001-01-01"])
+        kidx = ks.from_pandas(pidx)
+        self.assert_eq(kidx.is_month_start, pd.Index(pidx.is_month_start))
+        self.assert_eq(kidx.is_month_end, pd.Index(pidx.is_month_end))
+        self.assert_eq(kidx.is_quarter_start, pd.Index(pidx.is_quarter_start))
+        self.assert_eq(kidx.is_quarter_end, pd.Index(pidx.is_quarter_end))
+        self.assert_eq(kidx.is_year_start, pd.Index(pidx.is_year_start))
+        self.assert_eq(kidx.is_year_end, pd.Index(pidx.is_year_end))
+        self.assert_eq(kidx.is_leap_year, pd.Index(pidx.is_leap_year))
+
+    def test_datetime_index_from_pandas_datetime_index(self):
+        for pidx in self.pidxs:
+            self.assert_eq(ks.DatetimeIndex(pidx), pd.DatetimeIndex(pidx))
+            self.assert_eq(ks.DatetimeIndex(pidx, name="x"), pd.DatetimeIndex(pidx, name="x"))
+
+        pidx = pd.DatetimeIndex(["2004-01-01", "2002-12-31"], name="x")
+        self.assert_eq(ks.DatetimeIndex(pidx), pd.DatetimeIndex(pidx))
+        self.assert_eq(ks.DatetimeIndex(pidx, name="y"), pd.DatetimeIndex(pidx, name="y"))
+
+    def test_datetime_index_from_datetime_array(self):
+        pidx = pd.DatetimeIndex(["2004-01-01", "2002-12-31", "2000-04-01"])
+        self.assert_eq(ks.DatetimeIndex(pidx.values), pd.DatetimeIndex(pidx.values))
+        self.assert_eq(
+            ks.DatetimeIndex(pidx.values, name="x"), pd.DatetimeIndex(pidx.values, name="x")
+        )
+
+        pser = pd.Series(pidx, name="x")
+        self.assert_eq(ks.DatetimeIndex(pser), pd.DatetimeIndex(pser))
+
+    def test_week_at_year_boundaries(self):
+        pidx = pd.DatetimeIndex(["2016-01-01", "2018-12-31", "2020-12-31", "2021-01-03"])
+        kidx = ks.from_pandas(pidx)
+        self.assert_eq(kidx.week, pidx.week)
+        self.assert_eq(kidx.weekofyear, pidx.weekofyear)
+
+    def test_fields_as_spark_expressions(self):
+        # The fields should stay as Spark expressions, which Catalyst can optimize,
+        # rather than Python UDFs.
+        kidx = self.kidxs[1]
+        for field, spark_func in [
+            ("year", "year"),
+            ("month", "month"),
+            ("day", "dayofmonth"),
+            ("hour", "hour"),
+            ("minute", "minute"),
+            ("second", "second"),
+            ("week", "weekofyear"),
+            ("dayofweek", "dayofweek"),
+            ("dayofyear", "dayofyear"),
+            ("quarter", "quarter"),
+        ]:
+            scol_string = str(getattr(kidx, field).spark.column)
+            # Anchor the function name so that a pandas UDF such as `pandas_dayofweek(`
+            # does not match.
+            self.assertRegex(scol_string, r"(?<!\w){}\(".format(spark_func))
+            self.assertNotIn("pandas_", scol_string)
+
+    def test_datetime_index_from_list(self):
+        data = ["2004-01-02", "2002-12-31", "2000-04-01"]
+        self.assert_eq(ks.DatetimeIndex(data), pd.DatetimeIndex(data))
+        self.assert_eq(ks.DatetimeIndex(data, name="x"), pd.DatetimeIndex(data, name="x"))
+
+        data = ["01/02/2004", "31/12/2002", "01/04/2000"]
+        self.assert_eq(ks.DatetimeIndex(data, dayfirst=True), pd.DatetimeIndex(data, dayfirst=True))
+
+    def test_missing_attributes(self):
+        kidx = self.kidxs[1]
+        for _ in range(2):
+            self.assertRaises(PandasNotImplementedError, lambda: kidx.strftime("%Y"))
+            self.assertRaises(PandasNotImplementedError, lambda: kidx.tz)
+        # The missing functions are not bound to the instance, which would create a reference
+        # cycle between the index and the bound function.
+        self.assertNotIn("strftime", kidx.__dict__)
+        self.assertRaises(AttributeError, lambda: kidx.non_existent_attribute)
@@ -172,7 +172,7 @@ class SeriesDateTimeTest(ReusedSQLTestCase, SQLTestUtils):
         self.check_func(lambda x: x.dt.dayofyear)
 
     def test_quarter(self):
-        self.check_func(lambda x: x.dt.dayofyear)
+        self.check_func(lambda x: x.dt.quarter)
 
     def test_is_month_start(self):
         self.check_func(lambda x: x.dt.is_month_start)
@@ -195,6 +195,10 @@ class SeriesDateTimeTest(ReusedSQLTestCase, SQLTestUtils):
     def test_is_leap_year(self):
         self.check_func(lambda x: x.dt.is_leap_year)
 
+        pser = pd.Series(pd.to_datetime(["2000-01-01", None, "2100-01-01", "2012-01-01"]))
+        kser = ks.from_pandas(pser)
+        self.assert_eq(kser.dt.is_leap_year, pser.dt.is_leap_year)
+
     def test_daysinmonth(self):
         self.check_func(lambda x: x.dt.daysinmonth)
 
@@ -18,6 +18,7 @@ import pandas as pd
 
 from databricks.koalas.testing.utils import ReusedSQLTestCase, SQLTestUtils
 from databricks.koalas.utils import (
+    cache_readonly,
     lazy_property,
     validate_arguments_and_invoke_function,
     validate_bool_kwarg,
@@ -64,6 +65,32 @@ class UtilsTest(ReusedSQLTestCase, SQLTestUtils):
         self.assert_eq(obj.lazy_prop, 1)
         self.assert_eq(obj.lazy_prop, 1)
 
+    def test_cache_readonly(self):
+        obj = TestClassForCacheReadonly()
+        self.assert_eq(obj.cached_prop, 1)
+        self.assert_eq(obj.cached_prop, 1)
+        self.assertEqual(obj._cache, {"cached_prop": 1})
+
+        with self.assertRaises(AttributeError):
+            obj.cached_prop = 2
+
+        obj._cache.clear()
+        self.assert_eq(obj.cached_prop, 2)
+
+        self.assertEqual(TestClassForCacheReadonly.cached_prop.__doc__, "A cached property.")
+        self.assertEqual(TestClassForCacheReadonly.cached_prop.__name__, "cached_prop")
+
+    def test_cache_readonly_with_slots(self):
+        obj = TestClassForCacheReadonlyWithSlots()
+        self.assert_eq(obj.cached_prop, 1)
+        self.assert_eq(obj.cached_prop, 1)
+        self.assertEqual(obj._cache, {"cached_prop": 1})
+
+        # Without a `_cache` slot, the value is not cached.
+        obj = TestClassForCacheReadonlyWithoutCacheSlot()
+        self.assert_eq(obj.cached_prop, 1)
+        self.assert_eq(obj.cached_prop, 2)
+
     def test_validate_bool_kwarg(self):
         # This should pass and run fine
         koalas = True
@@ -89,3 +116,38 @@ class TestClassForLazyProp:
     def lazy_prop(self):
         self.some_variable += 1
         return self.some_variable
+
+
+class TestClassForCacheReadonly:
+    def __init__(self):
+        self.some_variable = 0
+
+    @cache_readonly
+    def cached_prop(self):
+        """A cached property."""
+        self.some_variable += 1
+        return self.some_variable
+
+
+class TestClassForCacheReadonlyWithSlots:
+    __slots__ = ("_cache", "some_variable")
+
+    def __init__(self):
+        self.some_variable = 0
+
+    @cache_readonly
+    def cached_prop(self):
+        self.some_variable += 1
+        return self.some_variable
+
+
+class TestClassForCacheReadonlyWithoutCacheSlot:
+    __slots__ = ("some_variable",)
+
+    def __init__(self):
+        self.some_variable = 0
+
+    @cache_readonly
+    def cached_prop(self):
+        self.some_variable += 1
+        return self.some_variable
@@ -552,6 +552,39 @@ def lazy_property(fn):
     return wrapped_lazy_property.deleter(deleter)
 
 
+class cache_readonly(object):
+    """
+    Decorator that makes a read-only property cached in the `_cache` dict of the instance.
+
+    Unlike `lazy_property`, the class can control the lifetime of the cached values by
+    defining `_cache` by itself, e.g., as a property returning a new dict once the
+    instance is updated. Otherwise, `_cache` is set to a new dict on the first access,
+    which also works with a `_cache` slot for classes using `__slots__`. If `_cache` cannot
+    be set, the value is computed without being cached.
+    """
+
+    def __init__(self, fn):
+        functools.update_wrapper(self, fn)
+        self.fn = fn
+        self.name = fn.__name__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cache = getattr(obj, "_cache", None)
+        if cache is None:
+            try:
+                obj._cache = cache = {}
+            except AttributeError:
+                return self.fn(obj)
+        if self.name not in cache:
+            cache[self.name] = self.fn(obj)
+        return cache[self.name]
+
+    def __set__(self, obj, value):
+        raise AttributeError("can't set attribute '{}'".format(self.name))
+
+
 def scol_for(sdf: spark.DataFrame, column_name: str) -> spark.Column:
     """ Return Spark Column for the given column name. """
     return sdf["`{}`".format(column_name)]